@@ -0,0 +1,7 @@
+from typing import Tuple
+
+import numpy as np
+
+def solve(
+    values: np.ndarray, weights: np.ndarray, capacity: int, lower_bound: int = ...
+) -> Tuple[int, np.ndarray]: ...
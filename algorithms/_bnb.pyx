@@ -0,0 +1,162 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""Cython version of the branch-and-bound solver.
+
+This module contains the depth-first branch-and-bound search with the integrality constraint
+relaxation, compiled to C.
+
+The search keeps an explicit stack of C structs and runs without the GIL.
+
+Build it in place by ::
+    $python setup.py build_ext --inplace
+
+"""
+
+from libc.stdint cimport int32_t, int64_t
+from libc.stdlib cimport free, malloc
+from libc.string cimport memcpy, memset
+
+import numpy as np
+
+
+cdef struct Node:
+    int64_t level
+    int64_t value
+    int64_t weight
+    int64_t bound
+    bint taken
+
+
+cdef int64_t _upper_bound(
+    int64_t level,
+    int64_t value,
+    int64_t weight,
+    const int32_t* W,
+    const int32_t* V,
+    int64_t cap,
+    int64_t n,
+) noexcept nogil:
+    """Calculate upperbound by relaxing integrality constraint."""
+    # If solution weight exceeds capacity, solution is not feasible and has upperbound 0
+    if weight > cap:
+        return 0
+    cdef int64_t j = level
+    # Fill knapsack with sorted items until you reach capacity
+    while j < n and weight + W[j] <= cap:
+        value += V[j]
+        weight += W[j]
+        j += 1
+    # Fill remaining part with fraction left, rounded down
+    if j < n:
+        value += (cap - weight) * V[j] // W[j]
+    return value
+
+
+cdef int64_t _search(
+    const int32_t* V,
+    const int32_t* W,
+    int64_t cap,
+    int64_t n,
+    int64_t lower_bound,
+    Node* stack,
+    unsigned char* path,
+    unsigned char* mask,
+) noexcept nogil:
+    """Depth-first search, saves the optimal selection in mask and returns its value."""
+    cdef int64_t optimal_value = lower_bound
+    cdef int64_t level, value, weight, new_value, new_weight, bound, right_bound
+    cdef Node node
+    cdef int top = 0
+
+    # Define initial solution and save in stack
+    stack[0].level = 0
+    stack[0].value = 0
+    stack[0].weight = 0
+    stack[0].bound = _upper_bound(0, 0, 0, W, V, cap, n)
+    stack[0].taken = False
+    top = 1
+
+    while top > 0:
+        top -= 1
+        node = stack[top]
+        level = node.level
+        value = node.value
+        weight = node.weight
+        bound = node.bound
+
+        # Record the decision on the last item, deeper levels are overwritten later on
+        if level > 0:
+            path[level - 1] = node.taken
+
+        # You can only explore until depth N-1, and we can't do better than the upperbound
+        if level >= n or bound <= optimal_value:
+            continue
+
+        # Explore right: leave out the next item
+        right_bound = _upper_bound(level + 1, value, weight, W, V, cap, n)
+        if right_bound > optimal_value:
+            stack[top].level = level + 1
+            stack[top].value = value
+            stack[top].weight = weight
+            stack[top].bound = right_bound
+            stack[top].taken = False
+            top += 1
+
+        # Explore left: add the next item if there is room for it. It is pushed last so
+        # that it is explored first.
+        new_weight = weight + W[level]
+        if new_weight <= cap:
+            new_value = value + V[level]
+            if new_value > optimal_value:
+                optimal_value = new_value
+                memcpy(mask, path, level)
+                memset(mask + level, 0, n - level)
+                mask[level] = 1
+            if bound > optimal_value:
+                stack[top].level = level + 1
+                stack[top].value = new_value
+                stack[top].weight = new_weight
+                stack[top].bound = bound
+                stack[top].taken = True
+                top += 1
+
+    return optimal_value
+
+
+def solve(
+    const int32_t[::1] values,
+    const int32_t[::1] weights,
+    int64_t capacity,
+    int64_t lower_bound=0,
+):
+    """Execute depth-first branch and bound, returns the optimal value and selection mask.
+
+    The search only looks for solutions that are better than the lower bound, the mask is
+    empty if there are none.
+    """
+    cdef int64_t n = values.shape[0]
+    path = np.zeros(n, dtype=np.uint8)
+    mask = np.zeros(n, dtype=np.uint8)
+    if n == 0:
+        return lower_bound, mask
+
+    cdef unsigned char[::1] path_view = path
+    cdef unsigned char[::1] mask_view = mask
+    cdef int64_t optimal_value
+    cdef Node* stack = <Node*> malloc((n + 2) * sizeof(Node))
+    if stack == NULL:
+        raise MemoryError()
+    try:
+        with nogil:
+            optimal_value = _search(
+                &values[0],
+                &weights[0],
+                capacity,
+                n,
+                lower_bound,
+                stack,
+                &path_view[0],
+                &mask_view[0],
+            )
+    finally:
+        free(stack)
+    return optimal_value, mask
@@ -0,0 +1,147 @@
+"""Numba kernels for the branch-and-bound solver.
+
+This module contains a compiled version of the depth-first branch-and-bound search with the
+integrality constraint relaxation.
+
+The search keeps an explicit stack in preallocated arrays and tracks the items on the current
+path in a bitmask of uint64 words, so no Python objects are allocated per node.
+
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def upper_bound(
+    level: int,
+    value: int,
+    weight: int,
+    values: np.ndarray,
+    weights: np.ndarray,
+    capacity: int,
+    n: int,
+) -> int:
+    """Calculate upperbound by relaxing integrality constraint."""
+    # If solution weight exceeds capacity, solution is not feasible and has upperbound 0
+    if weight > capacity:
+        return 0
+    j = level
+    estimate = value
+    # Fill knapsack with sorted items until you reach capacity
+    while j < n and weight + weights[j] <= capacity:
+        estimate += values[j]
+        weight += weights[j]
+        j += 1
+    # Fill remaining part with fraction left, rounded down
+    if j < n:
+        estimate += (capacity - weight) * np.int64(values[j]) // weights[j]
+    return estimate
+
+
+@njit(cache=True)
+def _copy_prefix(path: np.ndarray, level: int, out: np.ndarray) -> None:
+    """Copy the decisions on the first `level` items of `path` into `out`."""
+    out[:] = 0
+    full_words = level >> 6
+    out[:full_words] = path[:full_words]
+    remainder = level & 63
+    if remainder:
+        out[full_words] = path[full_words] & (
+            (np.uint64(1) << np.uint64(remainder)) - np.uint64(1)
+        )
+
+
+@njit(cache=True)
+def solve(
+    values: np.ndarray, weights: np.ndarray, capacity: int, lower_bound: int
+) -> Tuple[int, np.ndarray]:
+    """Execute depth-first branch and bound, returns the optimal value and selection bitmask.
+
+    The search only looks for solutions that are better than the lower bound, the bitmask is
+    empty if there are none.
+    """
+    n = values.shape[0]
+    n_words = (n + 63) // 64
+
+    # Every expanded node leaves at most one open sibling per level on the stack
+    size = n + 2
+    stack_level = np.empty(size, dtype=np.int64)
+    stack_value = np.empty(size, dtype=np.int64)
+    stack_weight = np.empty(size, dtype=np.int64)
+    stack_bound = np.empty(size, dtype=np.int64)
+    stack_taken = np.empty(size, dtype=np.bool_)
+
+    # Items taken on the current path, and in the best solution so far
+    path = np.zeros(n_words, dtype=np.uint64)
+    optimal_mask = np.zeros(n_words, dtype=np.uint64)
+    optimal_value = lower_bound
+
+    # Define initial solution and save in stack
+    stack_level[0] = 0
+    stack_value[0] = 0
+    stack_weight[0] = 0
+    stack_bound[0] = upper_bound(0, 0, 0, values, weights, capacity, n)
+    stack_taken[0] = False
+    top = 1
+
+    while top > 0:
+        top -= 1
+        level = stack_level[top]
+        value = stack_value[top]
+        weight = stack_weight[top]
+        bound = stack_bound[top]
+
+        # Record the decision on the last item, deeper levels are overwritten later on
+        if level > 0:
+            word = (level - 1) >> 6
+            bit = np.uint64(1) << np.uint64((level - 1) & 63)
+            if stack_taken[top]:
+                path[word] |= bit
+            else:
+                path[word] &= ~bit
+
+        # You can only explore until depth N-1, and we can't do better than the upperbound
+        if level >= n or bound <= optimal_value:
+            continue
+
+        # Explore right: leave out the next item. The upperbound is calculated inline, calls
+        # with array arguments update their reference counts, which dominates the loop.
+        right_bound = value
+        fill_weight = weight
+        j = level + 1
+        while j < n and fill_weight + weights[j] <= capacity:
+            right_bound += values[j]
+            fill_weight += weights[j]
+            j += 1
+        if j < n:
+            right_bound += (capacity - fill_weight) * np.int64(values[j]) // weights[j]
+        if right_bound > optimal_value:
+            stack_level[top] = level + 1
+            stack_value[top] = value
+            stack_weight[top] = weight
+            stack_bound[top] = right_bound
+            stack_taken[top] = False
+            top += 1
+
+        # Explore left: add the next item if there is room for it. It is pushed last so
+        # that it is explored first.
+        new_weight = weight + weights[level]
+        if new_weight <= capacity:
+            new_value = value + values[level]
+            if new_value > optimal_value:
+                optimal_value = new_value
+                _copy_prefix(path, level, optimal_mask)
+                optimal_mask[level >> 6] |= np.uint64(1) << np.uint64(level & 63)
+            # The item was part of the greedy fill of the parent, so the bound is unchanged
+            if bound > optimal_value:
+                stack_level[top] = level + 1
+                stack_value[top] = new_value
+                stack_weight[top] = new_weight
+                stack_bound[top] = bound
+                stack_taken[top] = True
+                top += 1
+
+    return optimal_value, optimal_mask
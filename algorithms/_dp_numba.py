@@ -0,0 +1,44 @@
+"""Numba kernels for the dynamic programming solver.
+
+This module contains a compiled version of the dynamic programming algorithm. Only a single row
+of the table is kept in memory; which items are taken is saved per item as a bitmask of uint64
+words over the capacities, from which the optimal selection is traced back.
+
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def solve(
+    values: np.ndarray, weights: np.ndarray, capacity: int
+) -> Tuple[int, np.ndarray]:
+    """Execute dynamic programming, returns the optimal value and selected items."""
+    n = values.shape[0]
+    n_words = (capacity + 64) // 64
+    # Optimal value per capacity, using the items seen so far
+    optimal_values = np.zeros(capacity + 1, dtype=np.int64)
+    # Bit c of row i is set if item i is taken in the optimal solution with capacity c
+    take = np.zeros((n, n_words), dtype=np.uint64)
+
+    for i in range(n):
+        value = values[i]
+        weight = weights[i]
+        # Walk down the capacities, so every item is taken at most once
+        for c in range(capacity, weight - 1, -1):
+            candidate = optimal_values[c - weight] + value
+            if candidate > optimal_values[c]:
+                optimal_values[c] = candidate
+                take[i, c >> 6] |= np.uint64(1) << np.uint64(c & 63)
+
+    # Trace back the taken items, starting from the full capacity
+    selected = np.zeros(n, dtype=np.bool_)
+    c = capacity
+    for i in range(n - 1, -1, -1):
+        if (take[i, c >> 6] >> np.uint64(c & 63)) & np.uint64(1):
+            selected[i] = True
+            c -= weights[i]
+    return optimal_values[capacity], selected
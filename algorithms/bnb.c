@@ -0,0 +1,139 @@
+/*
+ * C version of the branch-and-bound solver.
+ *
+ * This file contains the depth-first branch-and-bound search with the integrality constraint
+ * relaxation, as a plain C library without any Python API. It is loaded with ctypes by
+ * algorithms.knapsack_solvers.
+ *
+ * Build it in place by ::
+ *     $python setup.py build_ext --inplace
+ */
+
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+typedef struct {
+    int32_t level;
+    uint8_t taken;
+    int64_t value;
+    int64_t weight;
+    int64_t bound;
+} Node;
+
+/* Calculate upperbound by relaxing integrality constraint. */
+static int64_t upper_bound(
+    int32_t level,
+    int64_t value,
+    int64_t weight,
+    const int32_t *v,
+    const int32_t *w,
+    int32_t n,
+    int64_t capacity)
+{
+    /* If solution weight exceeds capacity, solution is not feasible and has upperbound 0 */
+    if (weight > capacity)
+        return 0;
+    /* Fill knapsack with sorted items until you reach capacity */
+    int32_t j = level;
+    while (j < n && weight + w[j] <= capacity) {
+        value += v[j];
+        weight += w[j];
+        j++;
+    }
+    /* Fill remaining part with fraction left, the room is smaller than w[j] so this fits */
+    if (j < n)
+        value += (capacity - weight) * v[j] / w[j];
+    return value;
+}
+
+/*
+ * Execute depth-first branch and bound on n sorted items.
+ *
+ * Sets out_mask[i] to 1 if the i-th sorted item is selected, and returns the optimal value.
+ * Only solutions better than lower_bound are searched for, out_mask is all zeros if there are
+ * none. Returns -1 if memory for the search could not be allocated.
+ */
+int64_t bnb_solve(
+    const int32_t *v,
+    const int32_t *w,
+    int32_t n,
+    int64_t capacity,
+    int64_t lower_bound,
+    uint8_t *out_mask)
+{
+    int64_t optimal_value = lower_bound;
+    int32_t level;
+    int64_t value, weight, bound, new_value, new_weight, right_bound;
+    int32_t top;
+
+    Node *stack = malloc(((size_t)n + 2) * sizeof(Node));
+    /* Items taken on the current path, deeper levels are overwritten later on */
+    uint8_t *path = calloc((size_t)n + 1, 1);
+    if (stack == NULL || path == NULL) {
+        free(stack);
+        free(path);
+        return -1;
+    }
+    memset(out_mask, 0, (size_t)n);
+
+    /* Define initial solution and save in stack */
+    stack[0].level = 0;
+    stack[0].taken = 0;
+    stack[0].value = 0;
+    stack[0].weight = 0;
+    stack[0].bound = upper_bound(0, 0, 0, v, w, n, capacity);
+    top = 1;
+
+    while (top > 0) {
+        top--;
+        level = stack[top].level;
+        value = stack[top].value;
+        weight = stack[top].weight;
+        bound = stack[top].bound;
+
+        /* Record the decision on the last item */
+        if (level > 0)
+            path[level - 1] = stack[top].taken;
+
+        /* You can only explore until depth N-1, and we can't do better than the upperbound */
+        if (level >= n || bound <= optimal_value)
+            continue;
+
+        /* Explore right: leave out the next item */
+        right_bound = upper_bound(level + 1, value, weight, v, w, n, capacity);
+        if (right_bound > optimal_value) {
+            stack[top].level = level + 1;
+            stack[top].taken = 0;
+            stack[top].value = value;
+            stack[top].weight = weight;
+            stack[top].bound = right_bound;
+            top++;
+        }
+
+        /* Explore left: add the next item if there is room for it. It is pushed last so
+         * that it is explored first. */
+        new_weight = weight + w[level];
+        if (new_weight <= capacity) {
+            new_value = value + v[level];
+            if (new_value > optimal_value) {
+                optimal_value = new_value;
+                memcpy(out_mask, path, (size_t)level);
+                memset(out_mask + level, 0, (size_t)(n - level));
+                out_mask[level] = 1;
+            }
+            if (bound > optimal_value) {
+                stack[top].level = level + 1;
+                stack[top].taken = 1;
+                stack[top].value = new_value;
+                stack[top].weight = new_weight;
+                stack[top].bound = bound;
+                top++;
+            }
+        }
+    }
+
+    free(stack);
+    free(path);
+    return optimal_value;
+}
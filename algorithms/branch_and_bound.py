@@ -9,11 +9,13 @@ You can do an example run by ::
 
 from abc import ABC, abstractmethod
 from collections import namedtuple
-from typing import List, Set, Tuple, Union
+from typing import Any, List, Tuple, Union
 
-Solution = namedtuple(
-    "Solution", ["level", "value", "weight", "optimistic_estimate", "products"]
-)
+import numpy as np
+
+# A solution is saved as a plain (level, value, weight, optimistic estimate, mask) tuple,
+# where bit i of the mask is set if the i-th sorted item is selected
+Solution = Tuple[int, int, int, Union[int, float], int]
 Item = namedtuple("Item", ["index", "value", "weight"])
 
 
@@ -25,139 +27,179 @@ class BranchAndBoundSolver(ABC):
         # Initialise solution objects
         self.items_selected = [0] * len(items)
         self.optimal_value = 0
-        self.optimal_solution: Set[int] = set()
+        self.optimal_mask = 0
 
         # Define values and weights
         self._sort_items()
         self._define_values_and_weights()
 
-        # Define queue with solutions
-        self.queue: List[Solution] = []
+        # Define queue with solutions, its entries depend on the used strategy
+        self.queue: List[Any] = []
 
     def _sort_items(self) -> None:
         """Sort items based on value to weight ratio."""
-        self.sorted_items = sorted(
-            self.items, key=lambda x: float(x.value) / float(x.weight), reverse=True
+        self.n = len(self.items)
+        self.item_values = np.fromiter(
+            (item.value for item in self.items), dtype=np.int64, count=self.n
+        )
+        self.item_weights = np.fromiter(
+            (item.weight for item in self.items), dtype=np.int64, count=self.n
         )
-        self.n = len(self.sorted_items)
+        self.item_indices = np.fromiter(
+            (item.index for item in self.items), dtype=np.int64, count=self.n
+        )
+        ratios = self.item_values / self.item_weights
+        self.sort_order = np.argsort(-ratios, kind="stable")
 
     def _define_values_and_weights(self) -> None:
         """Extracts values and weights from input."""
-        self.values = [item.value for item in self.sorted_items]
-        self.weights = [item.weight for item in self.sorted_items]
+        # Use int32 whenever the input fits, sums are calculated in int64
+        fits_int32 = (
+            self.n == 0
+            or max(self.item_values.max(), self.item_weights.max())
+            <= np.iinfo(np.int32).max
+        )
+        dtype = np.int32 if fits_int32 else np.int64
+        self.values = self.item_values[self.sort_order].astype(dtype)
+        self.weights = self.item_weights[self.sort_order].astype(dtype)
+        # Total value of the items from index k onwards, index n holds 0
+        self.suffix_value = np.concatenate(
+            (np.cumsum(self.values[::-1], dtype=np.int64)[::-1], [0])
+        )
 
     @abstractmethod
-    def _calculate_optimistic_estimate(self, solution: Solution) -> Union[int, float]:
+    def _calculate_optimistic_estimate(
+        self, level: int, value: int, weight: int
+    ) -> Union[int, float]:
         pass
 
-    def _set_solution(
-        self, level: int, value: int, weight: List[int], products: List[int]
-    ) -> Solution:
-        """Set solution corresponding to a specific node."""
-        solution = Solution(
-            level,
-            value,
-            weight,
-            0.0,  # Set default upperbound
-            products,
-        )
-        bound = self._calculate_optimistic_estimate(solution)
-        solution = solution._replace(
-            optimistic_estimate=bound
-        )  # Replace default upperbound
-        return solution
-
     def _get_final_solution(self) -> Tuple[int, List[int]]:
         """Set final solution corresponding to optimal node."""
-        for item in self.optimal_solution:
-            index = self.sorted_items[item - 1].index
-            self.items_selected[index] = 1
-        total_value = sum(vi * xi for (vi, xi) in zip(self.values, self.items_selected))
+        # Unpack the bitmask into a flag per sorted item
+        mask_bytes = self.optimal_mask.to_bytes((self.n + 7) // 8, "little")
+        taken = np.unpackbits(
+            np.frombuffer(mask_bytes, dtype=np.uint8), count=self.n, bitorder="little"
+        ).astype(bool)
+        selected = np.zeros(len(self.items), dtype=np.int8)
+        selected[self.item_indices[self.sort_order[taken]]] = 1
+        self.items_selected = selected.tolist()
+        total_value = int(self.values[taken].sum(dtype=np.int64))
         return total_value, self.items_selected
 
-    def _check_if_room_for_extra_item(
-        self, new_item: Item, current_solution: Solution
-    ) -> bool:
-        """Checks whether there is room to add an extra item to the current solution."""
-        room = self.capacity - (current_solution.weight + new_item.weight)
-        if room < 0:
-            return False
-        return True
-
-    def _check_if_solution_is_best(self, solution: Solution) -> None:
-        """Compare solution to current best, and"""
-        if solution.value > self.optimal_value:
-            self.optimal_value = solution.value
-            self.optimal_solution = set(solution.products)
-
-    def _explore_left(self, current_solution: Solution, level: int) -> None:
-        """Explore left pruned part of current solution."""
-        # Define new item
-        new_item = self.sorted_items[level - 1]
-
-        # Check whether you can add a new item
-        if self._check_if_room_for_extra_item(new_item, current_solution):
-            # If so, set new solution with new item
-            products = current_solution.products + [level]
-            solution = self._set_solution(
-                level=level,
-                value=current_solution.value + new_item.value,
-                weight=current_solution.weight + new_item.weight,
-                products=products,
-            )
-            # Check if new solution is best, if so save the solution
-            self._check_if_solution_is_best(solution)
-
-            # Explore solution further if upperbound is larger than current value,
-            # potentially its value can exceed the current optimal value
-            if solution.optimistic_estimate > self.optimal_value:
-                self.queue.append(solution)
-
-    def _explore_right(self, current_solution: Solution, level: int) -> None:
-        """Explore right pruned part of current solution."""
-        solution = self._set_solution(
-            level=level,
-            value=current_solution.value,
-            weight=current_solution.weight,
-            products=current_solution.products,
-        )
-        # Check if new solution is best, if so save the solution
-        self._check_if_solution_is_best(solution)
-
-        # Explore solution further if upperbound is larger than current value,
-        # potentially its value can exceed the current optimal value
-        if solution.optimistic_estimate > self.optimal_value:
-            self.queue.append(solution)
-
-    def _explore_tree(self, solution: Solution) -> None:
-        """Explore tree based on previous found values."""
-        if solution.level < self.n:  # You can only explore until depth N-1
-            if (
-                solution.optimistic_estimate > self.optimal_value
-            ):  # We can't do better than the upperbound
-                level = solution.level + 1
-                self._explore_left(solution, level)
-                self._explore_right(solution, level)
+    def _initial_solution(self) -> Solution:
+        """Define the solution at the root of the tree."""
+        return 0, 0, 0, self._calculate_optimistic_estimate(0, 0, 0), 0
+
+    def _greedy_solution(
+        self, level: int, value: int, weight: int, mask: int
+    ) -> Tuple[int, int]:
+        """Complete a solution by taking every next sorted item that still fits.
+
+        Returns the value and mask of the completed solution, which is feasible and can be
+        used as a starting point to prune on.
+        """
+        values = self.values[level:].tolist()
+        weights = self.weights[level:].tolist()
+        for i, (item_value, item_weight) in enumerate(
+            zip(values, weights), start=level
+        ):
+            if weight + item_weight <= self.capacity:
+                value += item_value
+                weight += item_weight
+                mask |= 1 << i
+        return value, mask
+
+    def _update_optimal_value(self, value: int) -> int:
+        """Save a new optimal value, and return the value to compare solutions with.
+
+        Solvers that search part of the tree can override this to share the optimal value.
+        """
+        return value
+
+    def _refresh_optimal_value(self, optimal_value: int) -> int:
+        """Return the value to prune the next solution on.
+
+        Solvers that search part of the tree can override this to prune on the optimal value
+        found by the other searches.
+        """
+        return optimal_value
+
+    @abstractmethod
+    def _push_solution(self, solution: Solution) -> None:
+        """Add a solution to the queue based on the used strategy."""
+        pass
 
     @abstractmethod
-    def _sort_solution_queue(self) -> None:
-        """Sort the queue of solutions based on the used strategy."""
+    def _pop_solution(self) -> Solution:
+        """Get the next solution to explore from the queue based on the used strategy."""
         pass
 
     def execute(self) -> Tuple[int, List[int]]:
         """Execute branch and bound algorithm."""
-        # Define initial solution and save in queue
-        upperbound = self._calculate_optimistic_estimate(Solution(0, 0, 0, 0, []))
-        init_solution = Solution(0, 0, 0, upperbound, [])
-        self.queue.append(init_solution)
-
-        while self.queue:
-            solution = (
-                self.queue.pop()
-            )  # Get the solution that last entered the queue (=depth first strategy)
-            self._explore_tree(solution=solution)  # Explore solution
-
-            # Sort the tree based on the defined strategy
-            self._sort_solution_queue()
-
+        # Define initial solution, and complete it greedily to start with a feasible solution
+        initial_solution = self._initial_solution()
+        level, value, weight, bound, mask = initial_solution
+        greedy_value, greedy_mask = self._greedy_solution(level, value, weight, mask)
+        if greedy_value > self.optimal_value:
+            self.optimal_value = self._update_optimal_value(greedy_value)
+            self.optimal_mask = greedy_mask
+
+        # Save initial solution in queue, unless the greedy solution attains the upperbound
+        if bound >= self.optimal_value + 1:
+            self._push_solution(initial_solution)
+
+        # Bind attributes used per node to locals, to avoid attribute lookups in the loop.
+        # Arrays are converted to lists of Python ints, which are faster to index.
+        values = self.values.tolist()
+        weights = self.weights.tolist()
+        capacity = self.capacity
+        n = self.n
+        suffix_value = self.suffix_value.tolist()
+        queue = self.queue
+        push_solution = self._push_solution
+        pop_solution = self._pop_solution
+        estimate = self._calculate_optimistic_estimate
+        update_optimal_value = self._update_optimal_value
+        refresh_optimal_value = self._refresh_optimal_value
+        optimal_value = self.optimal_value
+        optimal_mask = self.optimal_mask
+
+        while queue:
+            # Get the next solution based on the strategy
+            level, value, weight, bound, mask = pop_solution()
+            optimal_value = refresh_optimal_value(optimal_value)
+
+            # You can only explore until depth N-1, and we can't do better than the upperbound.
+            # Values are integers, so the upperbound has to exceed the optimal value by at
+            # least one. This also fathoms solutions whose upperbound equals their value.
+            if level >= n or bound < optimal_value + 1:
+                continue
+
+            # Explore left: add the next item if there is room for it
+            new_weight = weight + weights[level]
+            if new_weight <= capacity:
+                new_value = value + values[level]
+                new_mask = mask | (1 << level)
+                # Check if new solution is best, if so save the solution
+                if new_value > optimal_value:
+                    optimal_value = update_optimal_value(new_value)
+                    optimal_mask = new_mask
+                # Explore solution further if upperbound is larger than current value,
+                # potentially its value can exceed the current optimal value
+                left_bound = estimate(level + 1, new_value, new_weight)
+                if left_bound >= optimal_value + 1:
+                    push_solution(
+                        (level + 1, new_value, new_weight, left_bound, new_mask)
+                    )
+
+            # Explore right: leave out the next item. Its value equals the value of the
+            # current solution, so it can't be better than the optimal value. Skip it
+            # without calculating its upperbound if even all remaining items can't improve.
+            if value + suffix_value[level + 1] > optimal_value:
+                right_bound = estimate(level + 1, value, weight)
+                if right_bound >= optimal_value + 1:
+                    push_solution((level + 1, value, weight, right_bound, mask))
+
+        self.optimal_value = optimal_value
+        self.optimal_mask = optimal_mask
         return self._get_final_solution()
@@ -5,71 +5,162 @@ So far implemented:
 
     - Brand-and-Bound with capacity constraint relaxation.
     - Brand-and-Bound with integrality constraint relaxation.
+    - Brand-and-Bound with integrality constraint relaxation, compiled with Numba.
+    - Brand-and-Bound with integrality constraint relaxation, compiled with Cython.
+    - Brand-and-Bound with integrality constraint relaxation, written in C and loaded with ctypes.
+    - Dynamic programming, compiled with Numba.
 
 You can do an example run by, for example, ::
     $value, taken = BranchBoundIntegralityConstraint(items, capacity).execute()
 
 """
 
-from typing import List, Union
+import ctypes
+import heapq
+import itertools
+import os
+import sys
+from abc import abstractmethod
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
 from algorithms.branch_and_bound import BranchAndBoundSolver, Item, Solution
 
+try:
+    from algorithms import _bnb_numba, _dp_numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional, the pure Python solvers are used without it
+    NUMBA_AVAILABLE = False
+
+try:
+    from algorithms import _bnb
+
+    CYTHON_AVAILABLE = True
+except ImportError:  # The Cython extension is only available after it is built
+    CYTHON_AVAILABLE = False
+
+
+def _load_c_library() -> Optional[ctypes.CDLL]:
+    """Load the C library of the branch-and-bound solver, returns None if it can't be loaded."""
+    name = "libbnb.dll" if sys.platform == "win32" else "libbnb.so"
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+    if not os.path.exists(path):
+        return None
+    try:
+        library = ctypes.CDLL(path)
+    except OSError:  # E.g. a library built for another platform, or a truncated build
+        return None
+    library.bnb_solve.argtypes = [
+        np.ctypeslib.ndpointer(np.int32, flags="C_CONTIGUOUS"),
+        np.ctypeslib.ndpointer(np.int32, flags="C_CONTIGUOUS"),
+        ctypes.c_int32,
+        ctypes.c_int64,
+        ctypes.c_int64,
+        np.ctypeslib.ndpointer(np.uint8, flags="C_CONTIGUOUS"),
+    ]
+    library.bnb_solve.restype = ctypes.c_int64
+    return library
+
+
+_bnb_c = _load_c_library()
+C_AVAILABLE = _bnb_c is not None
+
 
 class BestFirstSolver(BranchAndBoundSolver):
+    def __init__(self, items: List[Item], capacity: int) -> None:
+        super().__init__(items, capacity)
+        # Counts down, so equal estimates are explored last in first out
+        self.counter = itertools.count(step=-1)
+
     @staticmethod
-    def sort_helper_best_first(sol: Solution) -> int:
-        return sol.optimistic_estimate
+    def sort_helper_best_first(sol: Solution) -> Union[int, float]:
+        return -sol[3]
+
+    def _push_solution(self, solution: Solution) -> None:
+        heapq.heappush(
+            self.queue,
+            (self.sort_helper_best_first(solution), next(self.counter), solution),
+        )
 
-    def _sort_solution_queue(self) -> None:
-        self.queue.sort(key=self.sort_helper_best_first)
+    def _pop_solution(self) -> Solution:
+        # Get the solution with the highest optimistic estimate (=best first strategy)
+        solution: Solution = heapq.heappop(self.queue)[-1]
+        return solution
 
 
 class DepthFirstSolver(BranchAndBoundSolver):
-    @staticmethod
-    def sort_helper_depth_first(sol: Solution) -> int:
-        return sol.level
+    def _push_solution(self, solution: Solution) -> None:
+        self.queue.append(solution)
 
-    def _sort_solution_queue(self) -> None:
-        self.queue.sort(key=self.sort_helper_depth_first)
+    def _pop_solution(self) -> Solution:
+        # Get the solution that last entered the queue (=depth first strategy)
+        solution: Solution = self.queue.pop()
+        return solution
 
 
 class BranchBoundCapacityConstraint(BranchAndBoundSolver):
     def __init__(self, items: List[Item], capacity: int) -> None:
         super().__init__(items, capacity)
-        self.cumsum_value = np.insert(np.cumsum([value for value in self.values]), 0, 0)
+        self.cumsum_value = np.concatenate(
+            ([0], np.cumsum(self.values, dtype=np.int64))
+        )
 
-    def _calculate_optimistic_estimate(self, solution: Solution) -> int:
+    def _calculate_optimistic_estimate(
+        self, level: int, value: int, weight: int
+    ) -> int:
         """Calculate upperbound by relaxing capacity constraint."""
-        next_item_idx = solution.level
-        estimate: int = (
-            solution.weight + self.cumsum_value[-1] - self.cumsum_value[next_item_idx]
-        )
+        estimate = value + int(self.cumsum_value[-1] - self.cumsum_value[level])
         return estimate
 
 
 class BranchBoundIntegralityConstraint(BranchAndBoundSolver):
-    def _calculate_optimistic_estimate(self, solution: Solution) -> Union[int, float]:
-        """Calculate upperbound by relaxing integrality constraint."""
-        solution_weight = solution.weight
+    # Largest number of cached upperbounds, the cache is cleared when it is full
+    MAX_BOUND_CACHE_SIZE = 2**18
+
+    def __init__(self, items: List[Item], capacity: int) -> None:
+        super().__init__(items, capacity)
+        # Values and weights as lists of Python ints, which are faster to index per item
+        self.value_list: List[int] = self.values.tolist()
+        self.weight_list: List[int] = self.weights.tolist()
+        # Upperbound minus value of solutions, by level and weight
+        self._bound_cache: Dict[Tuple[int, int], int] = {}
+
+    def _calculate_optimistic_estimate(
+        self, level: int, value: int, weight: int
+    ) -> int:
+        """Calculate upperbound by relaxing integrality constraint.
+
+        Values are integers, so the fraction is rounded down to keep the calculation exact.
+        The upperbound minus the value only depends on the level and weight of a solution, so
+        it is cached for solutions with the same level and weight, up to MAX_BOUND_CACHE_SIZE
+        entries.
+        """
+        room = self.capacity - weight
         # If solution weight exceeds capacity, solution is not feasible and has upperbound 0
-        if solution_weight > self.capacity:
+        if room < 0:
             return 0
-        j = solution.level
-        estimate = solution.value
-        # Fill knapsack with sorted items until you reach capacity
-        while j < self.n and solution_weight + self.weights[j] <= self.capacity:
-            estimate += self.values[j]
-            solution_weight += self.weights[j]
-            j += 1
-        # Fill remaining part with fraction left
-        if j < self.n:
-            estimate += (self.capacity - solution_weight) * (
-                self.values[j] / self.weights[j]
-            )
-        return estimate
+        key = (level, weight)
+        gain = self._bound_cache.get(key)
+        if gain is None:
+            values = self.value_list
+            weights = self.weight_list
+            gain = 0
+            j = level
+            # Fill knapsack with sorted items until you reach capacity. The fill usually
+            # stops after a few items, which is cheaper than a binary search from Python.
+            while j < self.n and weights[j] <= room:
+                gain += values[j]
+                room -= weights[j]
+                j += 1
+            # Fill remaining part with fraction left
+            if j < self.n:
+                gain += room * values[j] // weights[j]
+            if len(self._bound_cache) >= self.MAX_BOUND_CACHE_SIZE:
+                self._bound_cache.clear()
+            self._bound_cache[key] = gain
+        return value + gain
 
 
 # Define all strategy classes
@@ -95,3 +186,142 @@ class BranchBoundIntegralityConstraintDepthFirst(
     BranchBoundIntegralityConstraint, DepthFirstSolver
 ):
     pass
+
+
+class CompiledBranchBoundSolver(BranchBoundIntegralityConstraintDepthFirst):
+    @staticmethod
+    @abstractmethod
+    def _solve_compiled(
+        values: np.ndarray, weights: np.ndarray, capacity: int, lower_bound: int
+    ) -> Optional[Tuple[int, int]]:
+        """Search for a solution better than the lower bound with a compiled kernel.
+
+        The values and weights are int32 arrays of the items sorted on value to weight ratio.
+        Returns the optimal value and mask of the sorted items, where the mask is 0 if no
+        better solution exists, or None if the kernel is not available.
+        """
+        pass
+
+    @classmethod
+    def solve_compiled(
+        cls, values: np.ndarray, weights: np.ndarray, capacity: int, lower_bound: int
+    ) -> Optional[Tuple[int, int]]:
+        """Search with the compiled kernel of this solver.
+
+        Returns None if the kernel is not available, or if the values and weights don't fit in
+        32 bits.
+        """
+        if values.dtype != np.int32:
+            return None
+        return cls._solve_compiled(values, weights, capacity, lower_bound)
+
+    def execute(self) -> Tuple[int, List[int]]:
+        """Execute the compiled branch and bound algorithm, seeded with the greedy solution.
+
+        Falls back to the pure Python implementation if the kernel can't be used.
+        """
+        greedy_value, greedy_mask = self._greedy_solution(0, 0, 0, 0)
+        result = self.solve_compiled(
+            self.values, self.weights, self.capacity, greedy_value
+        )
+        if result is None:
+            return super().execute()
+        self.optimal_value, self.optimal_mask = result
+        if self.optimal_value <= greedy_value:
+            self.optimal_value, self.optimal_mask = greedy_value, greedy_mask
+        return self._get_final_solution()
+
+
+class BranchBoundIntegralityConstraintNumba(CompiledBranchBoundSolver):
+    @staticmethod
+    def _solve_compiled(
+        values: np.ndarray, weights: np.ndarray, capacity: int, lower_bound: int
+    ) -> Optional[Tuple[int, int]]:
+        """Search with the Numba kernel, returns None if Numba is not installed."""
+        if not NUMBA_AVAILABLE:
+            return None
+        value, mask = _bnb_numba.solve(values, weights, capacity, lower_bound)
+        return int(value), int.from_bytes(mask.astype("<u8").tobytes(), "little")
+
+
+class BranchBoundIntegralityConstraintCython(CompiledBranchBoundSolver):
+    @staticmethod
+    def _solve_compiled(
+        values: np.ndarray, weights: np.ndarray, capacity: int, lower_bound: int
+    ) -> Optional[Tuple[int, int]]:
+        """Search with the Cython extension, returns None if the extension is not built."""
+        if not CYTHON_AVAILABLE:
+            return None
+        value, mask = _bnb.solve(values, weights, capacity, lower_bound)
+        packed = np.packbits(mask, bitorder="little")
+        return int(value), int.from_bytes(packed.tobytes(), "little")
+
+
+class BranchBoundIntegralityConstraintC(CompiledBranchBoundSolver):
+    @staticmethod
+    def _solve_compiled(
+        values: np.ndarray, weights: np.ndarray, capacity: int, lower_bound: int
+    ) -> Optional[Tuple[int, int]]:
+        """Search with the C library, returns None if the library is not built."""
+        if _bnb_c is None:
+            return None
+        mask = np.zeros(len(values), dtype=np.uint8)
+        value = _bnb_c.bnb_solve(
+            values, weights, len(values), capacity, lower_bound, mask
+        )
+        if value < 0:
+            raise MemoryError()
+        packed = np.packbits(mask, bitorder="little")
+        return int(value), int.from_bytes(packed.tobytes(), "little")
+
+
+class DynamicProgrammingSolver:
+    def __init__(self, items: List[Item], capacity: int) -> None:
+        self.items = items
+        self.capacity = capacity
+        self.values = np.asarray([item.value for item in items], dtype=np.int64)
+        self.weights = np.asarray([item.weight for item in items], dtype=np.int64)
+
+    @staticmethod
+    def memory_required(n: int, capacity: int) -> int:
+        """Estimate the number of bytes used to solve n items with the given capacity.
+
+        This counts the rows of values per capacity, including the temporary rows of the
+        NumPy version, and a bit per item and capacity to trace back the taken items.
+        """
+        return 32 * (capacity + 1) + n * (capacity // 8 + 8)
+
+    def _solve_numpy(self) -> Tuple[int, np.ndarray]:
+        """Dynamic programming with a vectorised update per item, used without Numba."""
+        capacity = self.capacity
+        optimal_values = np.zeros(capacity + 1, dtype=np.int64)
+        take = np.zeros((len(self.items), capacity // 8 + 1), dtype=np.uint8)
+        for i, (value, weight) in enumerate(zip(self.values, self.weights)):
+            if weight > capacity:
+                continue
+            # Candidates are calculated from the previous row, so an item is taken once
+            candidates = optimal_values[: capacity + 1 - weight] + value
+            better = np.zeros(capacity + 1, dtype=bool)
+            better[weight:] = candidates > optimal_values[weight:]
+            optimal_values[better] = candidates[better[weight:]]
+            take[i] = np.packbits(better, bitorder="little")
+
+        # Trace back the taken items, starting from the full capacity
+        selected = np.zeros(len(self.items), dtype=bool)
+        c = capacity
+        for i in range(len(self.items) - 1, -1, -1):
+            if (take[i, c >> 3] >> (c & 7)) & 1:
+                selected[i] = True
+                c -= int(self.weights[i])
+        return int(optimal_values[capacity]), selected
+
+    def execute(self) -> Tuple[int, List[int]]:
+        """Execute dynamic programming algorithm."""
+        if NUMBA_AVAILABLE:
+            value, selected = _dp_numba.solve(self.values, self.weights, self.capacity)
+        else:
+            value, selected = self._solve_numpy()
+        items_selected = [0] * len(self.items)
+        for item, taken in zip(self.items, selected):
+            items_selected[item.index] = int(taken)
+        return int(value), items_selected
@@ -0,0 +1,189 @@
+"""Parallel branch and bound implementation.
+
+This module splits the branch-and-bound tree at a fixed depth and explores the subtrees in
+separate processes. The workers share the best value found so far, so every worker can prune
+on solutions that are found by the others. A subtree is solved by a compiled kernel if one is
+available, starting from the shared best value, otherwise by the Python search, which checks
+the shared best value while it runs.
+
+You can do an example run by, for example, ::
+    $value, taken = ParallelBranchAndBoundSolver(items, capacity).execute()
+
+"""
+
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, List, Optional, Tuple, Type
+
+from algorithms.branch_and_bound import Item, Solution
+from algorithms.knapsack_solvers import (
+    BranchBoundIntegralityConstraintC,
+    BranchBoundIntegralityConstraintCython,
+    BranchBoundIntegralityConstraintDepthFirst,
+    BranchBoundIntegralityConstraintNumba,
+    CompiledBranchBoundSolver,
+)
+
+# Compiled solvers whose kernel can solve a subtree, the first one that can be used is taken
+COMPILED_SOLVERS: List[Type[CompiledBranchBoundSolver]] = [
+    BranchBoundIntegralityConstraintCython,
+    BranchBoundIntegralityConstraintC,
+    BranchBoundIntegralityConstraintNumba,
+]
+
+# Best value found by all workers, set in every worker process by _init_worker
+_global_best: Any = None
+
+
+def _init_worker(global_best: Any) -> None:
+    """Make the shared best value available in a worker process."""
+    global _global_best
+    _global_best = global_best
+
+
+def _solve_subtree(
+    items: List[Item], capacity: int, prefix: Tuple[int, ...]
+) -> Tuple[int, List[int]]:
+    """Solve the subtree below the given decisions on the first items."""
+    return SubtreeSolver(items, capacity, prefix, _global_best).execute()
+
+
+class SubtreeSolver(BranchBoundIntegralityConstraintDepthFirst):
+    # Number of solutions popped from the queue between reads of the shared best value
+    SYNC_INTERVAL = 1000
+
+    def __init__(
+        self,
+        items: List[Item],
+        capacity: int,
+        prefix: Tuple[int, ...],
+        global_best: Any,
+    ) -> None:
+        super().__init__(items, capacity)
+        self.prefix = prefix
+        self.global_best = global_best
+        self.pops_until_sync = 0
+
+    def _initial_solution(self) -> Solution:
+        """Define the solution with the decisions of the prefix on the first items."""
+        value = weight = mask = 0
+        for i, taken in enumerate(self.prefix):
+            if taken:
+                value += int(self.values[i])
+                weight += int(self.weights[i])
+                mask |= 1 << i
+        self.optimal_value = self._update_optimal_value(value)
+        self.optimal_mask = mask
+
+        level = len(self.prefix)
+        bound = self._calculate_optimistic_estimate(level, value, weight)
+        return level, value, weight, bound, mask
+
+    def _update_optimal_value(self, value: int) -> int:
+        """Share a new optimal value with the other workers, and return the best of all."""
+        with self.global_best.get_lock():
+            if value > self.global_best.value:
+                self.global_best.value = value
+            best: int = self.global_best.value
+        return best
+
+    def _refresh_optimal_value(self, optimal_value: int) -> int:
+        """Return the best value of all workers, to prune the next solution on.
+
+        The shared best value is read every SYNC_INTERVAL solutions, to limit the lock traffic.
+        """
+        self.pops_until_sync -= 1
+        if self.pops_until_sync > 0:
+            return optimal_value
+        self.pops_until_sync = self.SYNC_INTERVAL
+        return max(optimal_value, self.global_best.value)
+
+    def execute(self) -> Tuple[int, List[int]]:
+        """Execute branch and bound algorithm on the subtree.
+
+        Uses the first compiled kernel that is available, which only searches for solutions
+        that are better than the best value of all workers at the start.
+        """
+        level, value, weight, _, mask = self._initial_solution()
+        lower_bound = self.optimal_value - value
+        for solver in COMPILED_SOLVERS:
+            result = solver.solve_compiled(
+                self.values[level:],
+                self.weights[level:],
+                self.capacity - weight,
+                lower_bound,
+            )
+            if result is not None:
+                gain, subtree_mask = result
+                if gain > lower_bound:
+                    self.optimal_value = self._update_optimal_value(value + gain)
+                    self.optimal_mask = mask | (subtree_mask << level)
+                return self._get_final_solution()
+        return super().execute()
+
+
+class ParallelBranchAndBoundSolver(BranchBoundIntegralityConstraintDepthFirst):
+    def __init__(
+        self,
+        items: List[Item],
+        capacity: int,
+        max_workers: Optional[int] = None,
+        depth: Optional[int] = None,
+    ) -> None:
+        super().__init__(items, capacity)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Create more subtrees than workers, so the workers stay busy until the end
+        if depth is None:
+            depth = self.max_workers.bit_length() + 1
+        self.depth = min(depth, self.n)
+
+    def _root_prefixes(self) -> List[Tuple[int, ...]]:
+        """Enumerate the feasible decisions on the first items, most promising first."""
+        values = self.values[: self.depth].tolist()
+        weights = self.weights[: self.depth].tolist()
+        prefixes = []
+        for prefix in itertools.product((1, 0), repeat=self.depth):
+            value = sum(v for v, taken in zip(values, prefix) if taken)
+            weight = sum(w for w, taken in zip(weights, prefix) if taken)
+            if weight <= self.capacity:
+                bound = self._calculate_optimistic_estimate(self.depth, value, weight)
+                prefixes.append((bound, prefix))
+        prefixes.sort(key=lambda x: x[0], reverse=True)
+        return [prefix for _, prefix in prefixes]
+
+    def _solve_subtrees(self, global_best: Any) -> List[Tuple[int, List[int]]]:
+        """Solve the subtrees below the root prefixes in a pool of worker processes."""
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(global_best,),
+        ) as executor:
+            futures = [
+                executor.submit(_solve_subtree, self.items, self.capacity, prefix)
+                for prefix in self._root_prefixes()
+            ]
+            return [future.result() for future in as_completed(futures)]
+
+    def execute(self) -> Tuple[int, List[int]]:
+        """Execute branch and bound algorithm on the subtrees in parallel."""
+        # Start from the greedy solution, the subtrees only report solutions that improve on it
+        _, self.optimal_mask = self._greedy_solution(0, 0, 0, 0)
+        self.optimal_value, self.items_selected = self._get_final_solution()
+        global_best = multiprocessing.Value("q", self.optimal_value)
+
+        if self.max_workers <= 1 or self.depth == 0:
+            # Search the whole tree in this process, with a compiled kernel if one is available
+            solutions = [
+                SubtreeSolver(self.items, self.capacity, (), global_best).execute()
+            ]
+        else:
+            solutions = self._solve_subtrees(global_best)
+
+        # Every subtree search returns the best solution in its subtree
+        for value, items_selected in solutions:
+            if value > self.optimal_value:
+                self.optimal_value = value
+                self.items_selected = items_selected
+        return self.optimal_value, self.items_selected
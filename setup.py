@@ -0,0 +1,70 @@
+"""Build the compiled extensions of the solvers.
+
+The extensions are optional, the solvers fall back to their pure Python implementation when
+they are not built. Without Cython installed, only the C library is built. Build them in
+place by ::
+    $python setup.py build_ext --inplace
+
+"""
+
+import os
+import sys
+
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+
+
+class SharedLibrary(Extension):
+    """Plain shared C library without Python API, loaded with ctypes."""
+
+
+class BuildExt(build_ext):
+    """Build the shared libraries with the Python extensions.
+
+    A shared library exports its own functions instead of the init function of a Python
+    module, which fails to link with MSVC, and its file name has no Python version tag.
+    """
+
+    def get_export_symbols(self, ext):
+        if isinstance(ext, SharedLibrary):
+            return ext.export_symbols
+        return super().get_export_symbols(ext)
+
+    def get_ext_filename(self, fullname):
+        if isinstance(self.ext_map.get(fullname), SharedLibrary):
+            suffix = ".dll" if sys.platform == "win32" else ".so"
+            return os.path.join(*fullname.split(".")) + suffix
+        return super().get_ext_filename(fullname)
+
+
+extensions = [
+    SharedLibrary(
+        "algorithms.libbnb",
+        ["algorithms/bnb.c"],
+        export_symbols=["bnb_solve"],
+        extra_compile_args=["-O3", "-march=native", "-funroll-loops"],
+    ),
+]
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # The Cython extension is optional as well
+    pass
+else:
+    extensions += cythonize(
+        [
+            Extension(
+                "algorithms._bnb",
+                ["algorithms/_bnb.pyx"],
+                extra_compile_args=["-O3", "-march=native"],
+            ),
+        ],
+        language_level=3,
+    )
+
+setup(
+    name="discrete_optimization",
+    packages=["algorithms"],
+    ext_modules=extensions,
+    cmdclass={"build_ext": BuildExt},
+)
@@ -1,11 +1,21 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
-from collections import namedtuple
 from typing import List
 
-from algorithms.knapsack_solvers import BranchBoundIntegralityConstraintDepthFirst
+from algorithms.branch_and_bound import Item
+from algorithms.knapsack_solvers import (
+    C_AVAILABLE,
+    CYTHON_AVAILABLE,
+    BranchBoundIntegralityConstraintC,
+    BranchBoundIntegralityConstraintCython,
+    BranchBoundIntegralityConstraintNumba,
+    DynamicProgrammingSolver,
+)
 
-Item = namedtuple("Item", ["index", "value", "weight"])
+# Largest number of cells (items x capacity) for which dynamic programming is used
+MAX_DYNAMIC_PROGRAMMING_SIZE = 10**8
+# Largest number of bytes that dynamic programming is allowed to use
+MAX_DYNAMIC_PROGRAMMING_MEMORY = 10**8
 
 
 def _parse_input(input_data: str):
@@ -36,8 +46,22 @@ def solve_it(input_data: str):
     # Parse input
     capacity, items = _parse_input(input_data)
 
-    # Branch and Bound
-    value, taken = BranchBoundIntegralityConstraintDepthFirst(items, capacity).execute()
+    # Dynamic programming for small tables, otherwise Branch and Bound.
+    # Use the Cython extension or the C library if one of them is built.
+    n = len(items)
+    if (
+        n * capacity <= MAX_DYNAMIC_PROGRAMMING_SIZE
+        and DynamicProgrammingSolver.memory_required(n, capacity)
+        <= MAX_DYNAMIC_PROGRAMMING_MEMORY
+    ):
+        solver = DynamicProgrammingSolver(items, capacity)
+    elif CYTHON_AVAILABLE:
+        solver = BranchBoundIntegralityConstraintCython(items, capacity)
+    elif C_AVAILABLE:
+        solver = BranchBoundIntegralityConstraintC(items, capacity)
+    else:
+        solver = BranchBoundIntegralityConstraintNumba(items, capacity)
+    value, taken = solver.execute()
 
     # Parse output
     output_data = _parse_output(value, taken)
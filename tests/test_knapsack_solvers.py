@@ -0,0 +1,184 @@
+import itertools
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List, Tuple, Type
+from unittest import mock
+
+from algorithms import knapsack_solvers
+from algorithms.branch_and_bound import Item
+from algorithms.knapsack_solvers import (
+    BranchBoundCapacityConstraintBestFirst,
+    BranchBoundCapacityConstraintDepthFirst,
+    BranchBoundIntegralityConstraintBestFirst,
+    BranchBoundIntegralityConstraintC,
+    BranchBoundIntegralityConstraintCython,
+    BranchBoundIntegralityConstraintDepthFirst,
+    BranchBoundIntegralityConstraintNumba,
+    CompiledBranchBoundSolver,
+    DynamicProgrammingSolver,
+    _load_c_library,
+)
+from solver import MAX_DYNAMIC_PROGRAMMING_MEMORY, _parse_input, solve_it
+
+DATA_DIRECTORY = Path(__file__).resolve().parent.parent / "data"
+
+SOLVERS = [
+    BranchBoundCapacityConstraintDepthFirst,
+    BranchBoundCapacityConstraintBestFirst,
+    BranchBoundIntegralityConstraintDepthFirst,
+    BranchBoundIntegralityConstraintBestFirst,
+    BranchBoundIntegralityConstraintNumba,
+    BranchBoundIntegralityConstraintCython,
+    BranchBoundIntegralityConstraintC,
+    DynamicProgrammingSolver,
+]
+
+COMPILED_SOLVERS: List[Type[CompiledBranchBoundSolver]] = [
+    BranchBoundIntegralityConstraintNumba,
+    BranchBoundIntegralityConstraintCython,
+    BranchBoundIntegralityConstraintC,
+]
+
+
+def brute_force(items: List[Item], capacity: int) -> int:
+    """Find the optimal value by trying every selection of items."""
+    best = 0
+    for taken in itertools.product((0, 1), repeat=len(items)):
+        weight = sum(item.weight for item, x in zip(items, taken) if x)
+        if weight <= capacity:
+            best = max(best, sum(item.value for item, x in zip(items, taken) if x))
+    return best
+
+
+def random_instance(rng: random.Random) -> Tuple[List[Item], int]:
+    """Create a small instance, with some equal ratios and items that never fit."""
+    n = rng.randint(0, 10)
+    items = [Item(i, rng.randint(1, 30), rng.randint(1, 20)) for i in range(n)]
+    capacity = rng.randint(0, 60)
+    return items, capacity
+
+
+class TestKnapsackSolvers(unittest.TestCase):
+    def assert_solution(
+        self,
+        items: List[Item],
+        capacity: int,
+        solution: Tuple[int, List[int]],
+        expected_value: int,
+    ) -> None:
+        """Check the value, and that the selection is feasible and attains the value."""
+        value, taken = solution
+        self.assertEqual(value, expected_value)
+        self.assertEqual(len(taken), len(items))
+        self.assertEqual(sum(item.value for item, x in zip(items, taken) if x), value)
+        self.assertLessEqual(
+            sum(item.weight for item, x in zip(items, taken) if x), capacity
+        )
+
+    def test_random_instances(self) -> None:
+        rng = random.Random(0)
+        for _ in range(200):
+            items, capacity = random_instance(rng)
+            expected_value = brute_force(items, capacity)
+            for solver in SOLVERS:
+                with self.subTest(
+                    solver=solver.__name__, items=items, capacity=capacity
+                ):
+                    solution = solver(items, capacity).execute()
+                    self.assert_solution(items, capacity, solution, expected_value)
+
+    def test_data_files(self) -> None:
+        expected_values = {"ks_4_0": 19, "ks_lecture_dp_1": 11, "ks_lecture_dp_2": 44}
+        for name, expected_value in expected_values.items():
+            capacity, items = _parse_input((DATA_DIRECTORY / name).read_text())
+            for solver in SOLVERS:
+                with self.subTest(solver=solver.__name__, data=name):
+                    solution = solver(items, capacity).execute()
+                    self.assert_solution(items, capacity, solution, expected_value)
+
+    def test_selection_of_unsorted_items(self) -> None:
+        # Sorting on ratio reorders the items, the selection refers to the input order
+        capacity, items = _parse_input((DATA_DIRECTORY / "ks_4_0").read_text())
+        for solver in SOLVERS:
+            with self.subTest(solver=solver.__name__):
+                self.assertEqual(solver(items, capacity).execute(), (19, [0, 0, 1, 1]))
+
+    def test_capacity_bound_uses_values(self) -> None:
+        # The remaining weight is far larger than the remaining value, a bound on weight
+        # would not prune anything, a bound on value must still give the optimum
+        items = [Item(0, 1, 100), Item(1, 2, 100), Item(2, 3, 100)]
+        solver = BranchBoundCapacityConstraintDepthFirst(items, 200)
+        self.assertEqual(solver._calculate_optimistic_estimate(0, 0, 0), 6)
+        self.assertEqual(solver.execute(), (5, [0, 1, 1]))
+
+    def test_bound_cache_is_limited(self) -> None:
+        rng = random.Random(1)
+        for _ in range(20):
+            items, capacity = random_instance(rng)
+            solver = BranchBoundIntegralityConstraintDepthFirst(items, capacity)
+            solver.MAX_BOUND_CACHE_SIZE = 4
+            self.assert_solution(
+                items, capacity, solver.execute(), brute_force(items, capacity)
+            )
+            self.assertLessEqual(len(solver._bound_cache), 4)
+
+    def test_dynamic_programming_without_numba(self) -> None:
+        rng = random.Random(2)
+        for _ in range(100):
+            items, capacity = random_instance(rng)
+            solver = DynamicProgrammingSolver(items, capacity)
+            value, selected = solver._solve_numpy()
+            with self.subTest(items=items, capacity=capacity):
+                self.assertEqual(value, brute_force(items, capacity))
+                self.assertEqual(
+                    sum(item.value for item, x in zip(items, selected) if x), value
+                )
+                self.assertLessEqual(
+                    sum(item.weight for item, x in zip(items, selected) if x), capacity
+                )
+
+    def test_large_capacity_skips_dynamic_programming(self) -> None:
+        # A single row of values per capacity would already take gigabytes
+        for n, capacity in [(1, 10**8), (0, 10**9)]:
+            self.assertGreater(
+                DynamicProgrammingSolver.memory_required(n, capacity),
+                MAX_DYNAMIC_PROGRAMMING_MEMORY,
+            )
+        self.assertEqual(solve_it("1 100000000\n5 7\n"), "5 0\n1")
+        self.assertEqual(solve_it("0 1000000000\n"), "0 0\n")
+
+    def test_compiled_search_with_lower_bound(self) -> None:
+        capacity, items = _parse_input((DATA_DIRECTORY / "ks_lecture_dp_2").read_text())
+        for solver_class in COMPILED_SOLVERS:
+            solver = solver_class(items, capacity)
+            args = (solver.values, solver.weights, capacity)
+            if solver.solve_compiled(*args, 0) is None:
+                continue  # The kernel is not available
+            with self.subTest(solver=solver_class.__name__):
+                value, mask = solver.solve_compiled(*args, 0)
+                self.assertEqual(value, 44)
+                self.assertNotEqual(mask, 0)
+                # Nothing is better than the optimum, so no selection is returned
+                self.assertEqual(solver.solve_compiled(*args, 44), (44, 0))
+
+    def test_compiled_search_of_large_values(self) -> None:
+        # Values that don't fit in 32 bits are kept as int64, no kernel is used for them
+        items = [Item(0, 2**40, 1), Item(1, 3, 1)]
+        for solver_class in COMPILED_SOLVERS:
+            solver = solver_class(items, 1)
+            with self.subTest(solver=solver_class.__name__):
+                self.assertIsNone(
+                    solver.solve_compiled(solver.values, solver.weights, 1, 0)
+                )
+                self.assertEqual(solver.execute(), (2**40, [1, 0]))
+
+    def test_unloadable_c_library(self) -> None:
+        # A file that can't be loaded as a library must not break importing the solvers
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ("libbnb.so", "libbnb.dll"):
+                (Path(directory) / name).write_bytes(b"not a shared library")
+            module_file = str(Path(directory) / "knapsack_solvers.py")
+            with mock.patch.object(knapsack_solvers, "__file__", module_file):
+                self.assertIsNone(_load_c_library())
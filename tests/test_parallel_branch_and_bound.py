@@ -0,0 +1,113 @@
+import multiprocessing
+import random
+import unittest
+from unittest import mock
+
+from algorithms.branch_and_bound import BranchAndBoundSolver, Item, Solution
+from algorithms.knapsack_solvers import (
+    NUMBA_AVAILABLE,
+    BranchBoundIntegralityConstraintNumba,
+)
+from algorithms.parallel_branch_and_bound import (
+    ParallelBranchAndBoundSolver,
+    SubtreeSolver,
+)
+from solver import _parse_input
+from tests.test_knapsack_solvers import DATA_DIRECTORY, brute_force, random_instance
+
+
+class TestParallelBranchAndBound(unittest.TestCase):
+    def test_random_instances(self) -> None:
+        rng = random.Random(3)
+        for _ in range(10):
+            items, capacity = random_instance(rng)
+            with self.subTest(items=items, capacity=capacity):
+                value, taken = ParallelBranchAndBoundSolver(
+                    items, capacity, max_workers=2
+                ).execute()
+                self.assertEqual(value, brute_force(items, capacity))
+                self.assertEqual(
+                    sum(item.value for item, x in zip(items, taken) if x), value
+                )
+                self.assertLessEqual(
+                    sum(item.weight for item, x in zip(items, taken) if x), capacity
+                )
+
+    def test_data_file(self) -> None:
+        capacity, items = _parse_input((DATA_DIRECTORY / "ks_4_0").read_text())
+        solver = ParallelBranchAndBoundSolver(items, capacity, max_workers=2)
+        self.assertEqual(solver.execute(), (19, [0, 0, 1, 1]))
+
+    def test_subtree_with_python_search(self) -> None:
+        rng = random.Random(4)
+        for _ in range(50):
+            items, capacity = random_instance(rng)
+            expected_value = brute_force(items, capacity)
+            global_best = multiprocessing.Value("q", 0)
+            # The feasible decisions on the first sorted item together cover the whole tree
+            prefixes = ParallelBranchAndBoundSolver(
+                items, capacity, depth=1
+            )._root_prefixes()
+            with mock.patch(
+                "algorithms.parallel_branch_and_bound.COMPILED_SOLVERS", []
+            ):
+                values = [
+                    SubtreeSolver(items, capacity, prefix, global_best).execute()[0]
+                    for prefix in prefixes
+                ]
+            with self.subTest(items=items, capacity=capacity):
+                self.assertEqual(max(values), expected_value)
+                self.assertEqual(global_best.value, expected_value)
+
+    def test_search_prunes_on_shared_best(self) -> None:
+        # The greedy solution takes the first three items for a value of 33, the optimum is 35
+        items = [Item(i, 10 + i, 5 + i) for i in range(4)]
+        global_best = multiprocessing.Value("q", 0)
+        solver = SubtreeSolver(items, 20, (), global_best)
+        pop_solution = solver._pop_solution
+
+        def pop_while_optimum_is_found() -> Solution:
+            # Another worker finds the optimum while this worker explores its subtree
+            global_best.value = 35
+            return pop_solution()
+
+        with mock.patch(
+            "algorithms.parallel_branch_and_bound.COMPILED_SOLVERS", []
+        ), mock.patch.object(
+            solver, "_pop_solution", side_effect=pop_while_optimum_is_found
+        ) as pop:
+            value, _ = solver.execute()
+        # Only solutions with an upperbound above 35 are explored, these are the root and the
+        # solutions on the greedy path. The optimum is pruned, this worker doesn't find it.
+        self.assertEqual(pop.call_count, 4)
+        self.assertEqual(value, 33)
+        self.assertEqual(global_best.value, 35)
+
+    def test_shared_best_is_read_every_sync_interval(self) -> None:
+        items = [Item(i, 10 + i, 5 + i) for i in range(4)]
+        global_best = multiprocessing.Value("q", 30)
+        solver = SubtreeSolver(items, 20, (), global_best)
+        self.assertEqual(solver._refresh_optimal_value(20), 30)
+
+        global_best.value = 35
+        for _ in range(solver.SYNC_INTERVAL - 1):
+            self.assertEqual(solver._refresh_optimal_value(30), 30)
+        self.assertEqual(solver._refresh_optimal_value(30), 35)
+        # A better value of this worker is kept
+        solver.pops_until_sync = 0
+        self.assertEqual(solver._refresh_optimal_value(40), 40)
+
+    @unittest.skipUnless(NUMBA_AVAILABLE, "Numba is not installed")
+    def test_single_process_uses_compiled_kernel(self) -> None:
+        capacity, items = _parse_input((DATA_DIRECTORY / "ks_lecture_dp_2").read_text())
+        for max_workers, depth in [(1, None), (2, 0)]:
+            solver = ParallelBranchAndBoundSolver(items, capacity, max_workers, depth)
+            with self.subTest(max_workers=max_workers, depth=depth), mock.patch(
+                "algorithms.parallel_branch_and_bound.COMPILED_SOLVERS",
+                [BranchBoundIntegralityConstraintNumba],
+            ), mock.patch.object(
+                BranchAndBoundSolver,
+                "execute",
+                side_effect=AssertionError("the Python search is used"),
+            ):
+                self.assertEqual(solver.execute()[0], 44)